@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from flask import Flask, render_template, abort
 
 APP_PORT = int(os.getenv("PORT", "5011"))
@@ -10,47 +15,102 @@ app = Flask(__name__)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data", "sample")
 
+# Low-cardinality keys; the Parquet files already store these as categoricals
+CSV_DTYPES = {"PartNum": "category", "Category": "category", "LMH": "category", "9_box": "category", "Action": "category"}
+
+FRAME_NAMES = ("inventory_params", "recommendations", "sales")
+
+@lru_cache(maxsize=len(FRAME_NAMES))
+def _read_frame(path: str, mtime: float) -> pd.DataFrame:
+    # Keyed on mtime: repeated load_frames() calls reuse unchanged files and re-read rebuilt ones
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, engine="pyarrow")
+    return _read_csv(path)
+
+def _read_csv(path: str) -> pd.DataFrame:
+    # pandas' pyarrow engine infers types before applying dtype=, which turns a numeric-looking
+    # PartNum like 00123 into 123; pin it to string at parse time, then categorise
+    table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(column_types={"PartNum": pa.string()}))
+    df = table.to_pandas()
+    return df.astype({c: t for c, t in CSV_DTYPES.items() if c in df.columns})
+
+def _frame_path(name: str) -> str:
+    # Use whichever of the Parquet and CSV copies was written last, so fresh CSVs
+    # dropped next to an older demo build win; Parquet wins ties (both from one build)
+    candidates = [os.path.join(DATA_DIR, f"{name}.{ext}") for ext in ("parquet", "csv")]
+    existing = [p for p in candidates if os.path.exists(p)]
+    return max(existing, key=os.path.getmtime) if existing else candidates[-1]
+
+def _load_frame(name: str) -> pd.DataFrame:
+    path = _frame_path(name)
+    app.logger.info("Loading %s from %s", name, path)
+    return _read_frame(path, os.path.getmtime(path))
+
 def load_frames():
-    inv_params = pd.read_csv(os.path.join(DATA_DIR, "inventory_params.csv"), dtype={"PartNum": str})
-    rec = pd.read_csv(os.path.join(DATA_DIR, "recommendations.csv"), dtype={"PartNum": str})
-    sales = pd.read_csv(os.path.join(DATA_DIR, "sales.csv"), dtype={"PartNum": str})
+    inv_params, rec, sales = (_load_frame(name) for name in FRAME_NAMES)
     return inv_params, rec, sales
 
 inv_params_df, rec_df, sales_df = load_frames()
 
-@app.route("/")
-def index():
+# Frames are read-only after load, so the dashboard aggregates are computed once here
+def _summary() -> dict:
     current_val = float((inv_params_df["OnHandQty"] * inv_params_df["UnitCost"]).sum())
-    orders_total = float(rec_df.loc[rec_df["Action"] == "Order", "ChangeValue"].sum())
-    reduce_total = float(rec_df.loc[rec_df["Action"] == "Reduce Stock", "ChangeValue"].sum())
-    projected_val = current_val + orders_total - reduce_total
+    totals = rec_df.groupby("Action", observed=True)["ChangeValue"].sum()
+    orders_total = float(totals.get("Order", 0.0))
+    reduce_total = float(totals.get("Reduce Stock", 0.0))
+    return dict(
+        current_inventory_value=current_val,
+        projected_inventory_value=current_val + orders_total - reduce_total,
+        orders_total=orders_total,
+        reduce_total=reduce_total,
+        category_counts=inv_params_df["Category"].value_counts().to_dict(),
+        nine_box_counts=inv_params_df["9_box"].value_counts().to_dict(),
+    )
+
+SUMMARY = _summary()
+AGG_RECORDS = rec_df.groupby(["Action","Category"], observed=True).size().reset_index(name="Count").to_dict("records")
+
+def _top_recommendations(df: pd.DataFrame, n: int = 200) -> pd.DataFrame:
+    # Same rows in the same order as sort_values(["Action","ChangeValue"], ascending=[True, False]).head(n):
+    # nlargest picks the top rows per action, then only that subset is sorted stably, so
+    # ties keep their original order and missing ChangeValue still sorts last
+    parts = []
+    for _, grp in df.groupby("Action", observed=True, sort=True):
+        if n <= 0:
+            break
+        picked = grp["ChangeValue"].fillna(-np.inf).nlargest(n, keep="first").index
+        top = grp[grp.index.isin(picked)].sort_values(
+            "ChangeValue", ascending=False, kind="stable", na_position="last"
+        )
+        parts.append(top)
+        n -= len(top)
+    return pd.concat(parts) if parts else df.head(0)
 
-    category_counts = inv_params_df["Category"].value_counts().to_dict()
-    nine_counts = inv_params_df["9_box"].value_counts().to_dict()
-    agg = rec_df.groupby(["Action","Category"]).size().reset_index(name="Count").to_dict("records")
+TOP_REC_RECORDS = _top_recommendations(rec_df).to_dict("records")
 
+# PartNum -> row lookups for /part; PartNum must be unique in both frames
+PART_INDEX = inv_params_df.set_index("PartNum", drop=False, verify_integrity=True)
+REC_INDEX = rec_df.set_index("PartNum", drop=False, verify_integrity=True)
+
+@app.route("/")
+def index():
     return render_template(
         "index.html",
-        summary=dict(
-            current_inventory_value=current_val,
-            projected_inventory_value=projected_val,
-            orders_total=orders_total,
-            reduce_total=reduce_total,
-            category_counts=category_counts,
-            nine_box_counts=nine_counts,
-        ),
-        aggregated=agg,
-        recommendations=rec_df.sort_values(["Action","ChangeValue"], ascending=[True, False]).head(200).to_dict("records"),
+        summary=SUMMARY,
+        aggregated=AGG_RECORDS,
+        recommendations=TOP_REC_RECORDS,
     )
 
 @app.route("/part/<part_num>")
 def part(part_num: str):
-    row = inv_params_df[inv_params_df["PartNum"] == part_num]
-    if row.empty:
+    try:
+        part_dict = PART_INDEX.loc[part_num].to_dict()
+    except KeyError:
         abort(404)
-    part_dict = row.iloc[0].to_dict()
-    rec_row = rec_df[rec_df["PartNum"] == part_num]
-    rec_dict = rec_row.iloc[0].to_dict() if not rec_row.empty else None
+    try:
+        rec_dict = REC_INDEX.loc[part_num].to_dict()
+    except KeyError:
+        rec_dict = None
     return render_template("part.html", part=part_dict, rec=rec_dict)
 
 if __name__ == "__main__":
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import os
 
+import pandas as pd
+
 from src.inventory_optimization.sample_data import generate_sample_inventory, generate_sample_sales
 from src.inventory_optimization.analysis import abc_classification, lmh_vod_classification, make_nine_box
 from src.inventory_optimization.inventory_math import ServiceLevelPolicy, safety_stock, reorder_point, eoq
 from src.inventory_optimization.recommendations import compute_actions
 
+# Low-cardinality keys stored as pandas categoricals (CSV output is unaffected)
+CATEGORY_COLS = ["PartNum", "Category", "LMH", "9_box", "Action"]
+
+
+def as_categories(df: pd.DataFrame) -> pd.DataFrame:
+    cols = [c for c in CATEGORY_COLS if c in df.columns]
+    return df.astype({c: "category" for c in cols})
+
 
 def main() -> None:
     out_dir = os.path.join("data", "sample")
@@ -21,19 +31,29 @@ def main() -> None:
 
     policy = ServiceLevelPolicy.default()
 
-    merged = inv.merge(nine[["PartNum", "Category", "9_box"]], on="PartNum", how="left")
-    merged["Category"] = merged["Category"].fillna("C")
-    merged["9_box"] = merged["9_box"].fillna("CH")
-
-    stats = lmh.set_index("PartNum")[["avg_usage", "std", "LMH", "vod"]]
-    merged = merged.join(stats, on="PartNum")
-
-    merged["ServiceLevel"] = merged["9_box"].apply(policy.get)
-    merged["Z"] = merged["9_box"].apply(policy.z)
-
-    merged["SafetyStock"] = merged.apply(lambda r: safety_stock(r["std"], r["LeadTimeDays"], r["Z"]), axis=1)
-    merged["ReorderPoint"] = merged.apply(lambda r: reorder_point(r["avg_usage"], r["LeadTimeDays"], r["SafetyStock"]), axis=1)
-    merged["EOQ"] = merged.apply(lambda r: eoq(r["avg_usage"] * 12.0, ordering_cost=50.0, unit_cost=r["UnitCost"], holding_rate=0.2), axis=1)
+    # One aligned left join on the shared PartNum index
+    merged = (
+        inv.set_index("PartNum")
+        .join(
+            [
+                nine.set_index("PartNum")[["Category", "9_box"]],
+                lmh.set_index("PartNum")[["avg_usage", "std", "LMH", "vod"]],
+            ],
+            how="left",
+        )
+        .reset_index()
+        .fillna({"Category": "C", "9_box": "CH"})
+    )
+
+    merged["ServiceLevel"] = merged["9_box"].map(policy.policy).fillna(policy.default_level)
+    merged["Z"] = merged["9_box"].map(policy.z_table).fillna(policy.default_z)
+
+    std = merged["std"].to_numpy()
+    avg = merged["avg_usage"].to_numpy()
+    lead_time = merged["LeadTimeDays"].to_numpy()
+    merged["SafetyStock"] = safety_stock(std, lead_time, merged["Z"].to_numpy())
+    merged["ReorderPoint"] = reorder_point(avg, lead_time, merged["SafetyStock"].to_numpy())
+    merged["EOQ"] = eoq(avg * 12.0, ordering_cost=50.0, unit_cost=merged["UnitCost"].to_numpy(), holding_rate=0.2)
 
     merged.rename(columns={"avg_usage": "AvgMonthlyDemand", "std": "StdMonthlyDemand"}, inplace=True)
 
@@ -51,6 +71,15 @@ def main() -> None:
     inventory_params.to_csv(os.path.join(out_dir, "inventory_params.csv"), index=False)
     rec.to_csv(os.path.join(out_dir, "recommendations.csv"), index=False)
 
+    sales = as_categories(sales)
+    inventory_params = as_categories(inventory_params)
+    rec = as_categories(rec)
+
+    # Typed columnar copies for the app; the CSVs stay as the human-readable export
+    sales.to_parquet(os.path.join(out_dir, "sales.parquet"), engine="pyarrow", index=False)
+    inventory_params.to_parquet(os.path.join(out_dir, "inventory_params.parquet"), engine="pyarrow", index=False)
+    rec.to_parquet(os.path.join(out_dir, "recommendations.parquet"), engine="pyarrow", index=False)
+
     print("Demo data generated under data/sample/")
 
 if __name__ == "__main__":
@@ -12,24 +12,22 @@ class ABCThresholds:
     a_pct: float = 75.0
     b_pct: float = 95.0
 
+    def __post_init__(self) -> None:
+        # abc_classification's searchsorted lookup needs the thresholds in ascending order
+        if self.a_pct > self.b_pct:
+            raise ValueError(f"a_pct ({self.a_pct}) must not exceed b_pct ({self.b_pct})")
+
 
 def abc_classification(sales_df: pd.DataFrame, thresholds: ABCThresholds = ABCThresholds()) -> pd.DataFrame:
-    df = sales_df[["PartNum", "TotalValue"]].copy()
-    df["TotalValue"] = df["TotalValue"].fillna(0.0)
-    agg = df.groupby("PartNum", as_index=False)["TotalValue"].sum()
+    # groupby-sum skips missing values, so no filled copy of the input is needed
+    agg = sales_df.groupby("PartNum", as_index=False)["TotalValue"].sum()
     agg = agg.sort_values("TotalValue", ascending=False)
     agg["CumulativeValue"] = agg["TotalValue"].cumsum()
     total = float(agg["TotalValue"].sum()) or 1.0
     agg["CumulativePercentage"] = 100.0 * agg["CumulativeValue"] / total
-
-    def cat(p):
-        if p <= thresholds.a_pct:
-            return "A"
-        if p <= thresholds.b_pct:
-            return "B"
-        return "C"
-
-    agg["Category"] = agg["CumulativePercentage"].apply(cat)
+    # side="left" maps p <= a_pct to 0 (A), p <= b_pct to 1 (B), anything above to 2 (C)
+    idx = np.searchsorted([thresholds.a_pct, thresholds.b_pct], agg["CumulativePercentage"].to_numpy(), side="left")
+    agg["Category"] = np.array(["A", "B", "C"], dtype=object)[idx]
     return agg[["PartNum", "TotalValue", "CumulativePercentage", "Category"]]
 
 
@@ -48,30 +46,34 @@ def lmh_vod_classification(
     start_date = current_month_end - pd.DateOffset(months=months - 1) - pd.offsets.MonthBegin(1)
     df = df[(df["Date"] >= start_date) & (df["Date"] <= current_month_end)]
 
-    all_months = pd.period_range(start=start_date, end=current_month_end, freq="M")
-    pivot = (
-        df.pivot_table(index="PartNum", columns="Month", values="TotalDemand", aggfunc="sum")
-        .reindex(columns=all_months)
-        .fillna(0.0)
-    )
+    # Sparse per-month totals; months without sales contribute zeros to the moments below
+    monthly = df.groupby(["PartNum", "Month"])["TotalDemand"].sum()
+    part_totals = monthly.groupby(level="PartNum").sum()
+    stats = pd.DataFrame(index=part_totals.index)
+    total = part_totals.to_numpy(dtype=np.float64)
+    total_sq = (monthly ** 2).groupby(level="PartNum").sum().to_numpy(dtype=np.float64)
 
     txn_counts = df.groupby("PartNum").size()
 
-    pivot["std"] = pivot.iloc[:, :months].std(axis=1, ddof=1)
-    pivot["avg_usage"] = pivot.iloc[:, :months].mean(axis=1)
-    pivot["vod"] = np.where(pivot["avg_usage"] == 0, 0.0, pivot["std"] / pivot["avg_usage"])
-    pivot["has_sufficient_data"] = txn_counts.reindex(pivot.index).fillna(0).ge(min_transactions)
+    avg = total / months
+    std = np.sqrt(np.clip((total_sq - total * total / months) / (months - 1), 0.0, None))
+    # Divide only where there is demand; parts with zero average keep vod = 0
+    vod = np.zeros_like(std)
+    np.divide(std, avg, out=vod, where=avg != 0)
+    stats["avg_usage"] = avg
+    stats["std"] = std
+    stats["vod"] = vod
+    stats["has_sufficient_data"] = txn_counts.reindex(stats.index).fillna(0).ge(min_transactions)
 
     low_t, high_t = vod_thresholds
     conditions = [
-        pivot["vod"] <= low_t,
-        (pivot["vod"] > low_t) & (pivot["vod"] <= high_t),
-        pivot["vod"] > high_t,
+        ~stats["has_sufficient_data"].to_numpy(),
+        vod <= low_t,
+        vod <= high_t,
     ]
-    pivot["LMH"] = np.select(conditions, ["L", "M", "H"], default="H")
-    pivot.loc[~pivot["has_sufficient_data"], "LMH"] = "H"
+    stats["LMH"] = np.select(conditions, ["H", "L", "M"], default="H")
 
-    return pivot.reset_index()[["PartNum", "vod", "avg_usage", "std", "LMH"]]
+    return stats.reset_index()[["PartNum", "vod", "avg_usage", "std", "LMH"]]
 
 
 def make_nine_box(abc_df: pd.DataFrame, lmh_df: pd.DataFrame) -> pd.DataFrame:
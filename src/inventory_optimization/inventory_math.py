@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from functools import cached_property
+from typing import Dict, Union
 
 import numpy as np
 from scipy.stats import norm
 
+ArrayLike = Union[float, np.ndarray]
+
 
 @dataclass(frozen=True)
 class ServiceLevelPolicy:
     policy: Dict[str, float]
+    # Service level for 9-box keys missing from the policy
+    default_level: float = 0.85
 
     @staticmethod
     def default() -> "ServiceLevelPolicy":
@@ -24,33 +29,48 @@ class ServiceLevelPolicy:
         )
 
     def get(self, nine_box: str) -> float:
-        return float(self.policy.get(nine_box, 0.85))
+        return float(self.policy.get(nine_box, self.default_level))
 
     def z(self, nine_box: str) -> float:
         return float(norm.ppf(self.get(nine_box)))
 
+    @property
+    def default_z(self) -> float:
+        return float(norm.ppf(self.default_level))
+
+    @cached_property
+    def z_table(self) -> Dict[str, float]:
+        # Single vectorised ppf over all service levels, for Series.map lookups
+        zs = norm.ppf(np.fromiter(self.policy.values(), dtype=float, count=len(self.policy)))
+        return dict(zip(self.policy.keys(), zs.tolist()))
+
+
+def _to_units(x: ArrayLike) -> Union[int, np.ndarray]:
+    # Round to whole units; non-finite or negative values become 0.
+    # Scalars come back as int, arrays as int64 arrays.
+    x = np.asarray(x, dtype=float)
+    units = np.rint(np.where(np.isfinite(x) & (x > 0), x, 0.0)).astype(np.int64)
+    return int(units) if units.ndim == 0 else units
+
 
-def safety_stock(std_monthly: float, lead_time_days: float, z: float) -> int:
-    lt_m = max(float(lead_time_days) / 30.0, 0.0)
-    ss = z * float(std_monthly) * np.sqrt(lt_m)
-    if not np.isfinite(ss) or ss < 0:
-        return 0
-    return int(round(ss))
+def safety_stock(std_monthly: ArrayLike, lead_time_days: ArrayLike, z: ArrayLike) -> Union[int, np.ndarray]:
+    lt_m = np.maximum(np.asarray(lead_time_days, dtype=float) / 30.0, 0.0)
+    ss = np.asarray(z, dtype=float) * np.asarray(std_monthly, dtype=float) * np.sqrt(lt_m)
+    return _to_units(ss)
 
 
-def reorder_point(avg_monthly: float, lead_time_days: float, safety_stock_units: int) -> int:
-    lt_m = max(float(lead_time_days) / 30.0, 0.0)
-    rop = (float(avg_monthly) * lt_m) + int(safety_stock_units)
-    if not np.isfinite(rop) or rop < 0:
-        return 0
-    return int(round(rop))
+def reorder_point(avg_monthly: ArrayLike, lead_time_days: ArrayLike, safety_stock_units: ArrayLike) -> Union[int, np.ndarray]:
+    lt_m = np.maximum(np.asarray(lead_time_days, dtype=float) / 30.0, 0.0)
+    rop = (np.asarray(avg_monthly, dtype=float) * lt_m) + np.asarray(safety_stock_units, dtype=np.int64)
+    return _to_units(rop)
 
 
-def eoq(annual_demand: float, ordering_cost: float, unit_cost: float, holding_rate: float = 0.2) -> int:
-    h = float(unit_cost) * float(holding_rate)
-    if h <= 0 or annual_demand <= 0 or ordering_cost <= 0:
-        return 0
-    q = np.sqrt((2.0 * float(annual_demand) * float(ordering_cost)) / h)
-    if not np.isfinite(q) or q < 0:
-        return 0
-    return int(round(q))
+def eoq(
+    annual_demand: ArrayLike, ordering_cost: ArrayLike, unit_cost: ArrayLike, holding_rate: ArrayLike = 0.2
+) -> Union[int, np.ndarray]:
+    annual_demand = np.asarray(annual_demand, dtype=float)
+    ordering_cost = np.asarray(ordering_cost, dtype=float)
+    h = np.asarray(unit_cost, dtype=float) * np.asarray(holding_rate, dtype=float)
+    valid = (h > 0) & (annual_demand > 0) & (ordering_cost > 0)
+    q = np.sqrt(np.where(valid, 2.0 * annual_demand * ordering_cost, 0.0) / np.where(valid, h, 1.0))
+    return _to_units(q)
@@ -1,21 +1,29 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
 
 def compute_actions(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    out["TotalInv"] = out["OnHandQty"] + out.get("TotalPOQty", 0)
-    out["Action"] = "No Action"
-    out["Calculated_Quantity"] = 0
+    total_inv = df["OnHandQty"] + df.get("TotalPOQty", 0)
 
-    order = out["TotalInv"] < out["ReorderPoint"]
-    reduce = out["TotalInv"] > (out["ReorderPoint"] + out["EOQ"])
+    total = total_inv.to_numpy()
+    rop = df["ReorderPoint"].to_numpy()
+    eoq_a = df["EOQ"].to_numpy()
+    order = total < rop
+    reduce = total > (rop + eoq_a)
 
-    out.loc[order, "Action"] = "Order"
-    out.loc[order, "Calculated_Quantity"] = out.loc[order, "EOQ"]
+    # Reduce is listed first so it wins, as when it was applied last
+    action = np.select([reduce, order], ["Reduce Stock", "Order"], default="No Action")
+    qty = np.select([reduce, order], [total - (rop + eoq_a), eoq_a], default=0)
+    # NaN inputs make the choices float; keep whole-unit quantities integral unless a NaN was selected
+    if qty.dtype.kind == "f" and np.isfinite(qty).all() and (qty == np.rint(qty)).all():
+        qty = qty.astype(np.int64)
 
-    out.loc[reduce, "Action"] = "Reduce Stock"
-    out.loc[reduce, "Calculated_Quantity"] = out.loc[reduce, "TotalInv"] - (out.loc[reduce, "ReorderPoint"] + out.loc[reduce, "EOQ"])
-
-    out["ChangeValue"] = out["Calculated_Quantity"] * out["UnitCost"]
-    return out
+    # assign still copies df's blocks (pandas 2.2 without Copy-on-Write); it saves the
+    # separate column inserts, not the copy
+    return df.assign(
+        TotalInv=total_inv,
+        Action=action,
+        Calculated_Quantity=qty,
+        ChangeValue=qty * df["UnitCost"],
+    )
@@ -27,27 +27,25 @@ def generate_sample_inventory(n_parts: int = 200, seed: int = 7) -> pd.DataFrame
 
 def generate_sample_sales(inventory_df: pd.DataFrame, months: int = 36, seed: int = 7) -> pd.DataFrame:
     rng = np.random.default_rng(seed)
-    parts = inventory_df["PartNum"].tolist()
+    parts = inventory_df["PartNum"].to_numpy()
     end = pd.Timestamp.now().normalize().replace(day=1) + pd.offsets.MonthEnd(0)
     start = end - pd.DateOffset(months=months-1) - pd.offsets.MonthBegin(1)
     all_months = pd.period_range(start=start, end=end, freq="M")
 
-    rows = []
-    for p in parts:
-        base = float(inventory_df.loc[inventory_df["PartNum"] == p, "UnitCost"].iloc[0])
-        lam = max(0.2, min(10.0, 300.0 / (base + 1.0)))
-        for m in all_months:
-            qty = rng.poisson(lam=lam)
-            if rng.random() < 0.35:
-                qty = 0
-            unit_price = base * rng.uniform(1.2, 2.0)
-            rows.append({
-                "PartNum": p,
-                "Date": m.to_timestamp(how="end"),
-                "TotalDemand": int(qty),
-                "UnitPrice": round(unit_price, 2),
-                "Description": inventory_df.loc[inventory_df["PartNum"] == p, "Description"].iloc[0],
-            })
-    sales = pd.DataFrame(rows)
-    sales["TotalValue"] = sales["TotalDemand"] * sales["UnitPrice"]
+    base = inventory_df["UnitCost"].to_numpy(dtype=float)
+    n_parts, n_months = len(parts), len(all_months)
+    lam = np.clip(300.0 / (base + 1.0), 0.2, 10.0)
+    qty = rng.poisson(lam=np.broadcast_to(lam[:, None], (n_parts, n_months)))
+    qty[rng.random((n_parts, n_months)) < 0.35] = 0
+    unit_price = (base[:, None] * rng.uniform(1.2, 2.0, size=(n_parts, n_months))).round(2)
+
+    # Everything is derived on the (parts x months) matrices; the frame only flattens them
+    sales = pd.DataFrame({
+        "PartNum": np.repeat(parts, n_months),
+        "Date": np.tile(all_months.to_timestamp(how="end"), n_parts),
+        "TotalDemand": qty.ravel(),
+        "UnitPrice": unit_price.ravel(),
+        "Description": np.repeat(inventory_df["Description"].to_numpy(), n_months),
+        "TotalValue": (qty * unit_price).ravel(),
+    })
     return sales